@@ -6,11 +6,12 @@ The hooks are configured via a YAML file whose structure is defined by
 the `Configuration` class.
 """
 
-import copy
 import dataclasses
+import functools
 import os
 import pathlib
-from typing import Any, Dict, Iterator, List, Optional
+import re
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 import baydemir.parsing
 import kubernetes_asyncio.client as k8s  # type: ignore[import-untyped]
@@ -33,6 +34,9 @@ CONDOR_UID_DOMAIN = os.environ.get("_condor_UID_DOMAIN")
 
 NOTEBOOK_CONTAINER_NAME = "notebook"
 
+USER_FIELD_RE = re.compile(r"\{user\.(\w+)\}")
+USER_FIELDS = tuple(f.name for f in dataclasses.fields(comanage.OSPoolPerson))
+
 
 @dataclasses.dataclass
 class KubespawnerOverride:
@@ -46,6 +50,10 @@ class KubespawnerOverride:
     groups: List[str]
     override: Dict[str, Any]
 
+    @functools.cached_property
+    def groups_set(self) -> FrozenSet[str]:
+        return frozenset(self.groups)
+
 
 @dataclasses.dataclass
 class ProfileList:
@@ -59,6 +67,10 @@ class ProfileList:
     groups: List[str]
     servers: List[Dict[str, Any]]
 
+    @functools.cached_property
+    def groups_set(self) -> FrozenSet[str]:
+        return frozenset(self.groups)
+
 
 @dataclasses.dataclass
 class Configuration:
@@ -83,10 +95,11 @@ class Configuration:
 
 def auth_state_hook(spawner, auth_state) -> None:
     """
-    Saves the user's OIDC userinfo object to the spawner.
+    Saves the user's OIDC userinfo object and COmanage person to the spawner.
     """
 
     spawner.userdata = (auth_state or {}).get("cilogon_user", {})
+    spawner.person = comanage.get_person(spawner.userdata)
 
 
 def options_form(spawner) -> str:
@@ -95,7 +108,7 @@ def options_form(spawner) -> str:
     """
     ## Reference: https://discourse.jupyter.org/t/tailoring-spawn-options-and-server-configuration-to-certain-users/8449
 
-    person = comanage.get_person(spawner.userdata)
+    person = getattr(spawner, "person", None)
     if not person:
         person = comanage.COmanagePerson(sub="", groups=[])
 
@@ -106,19 +119,30 @@ def options_form(spawner) -> str:
     config = get_config()
     spawner.profile_list = []
 
+    ## The configuration is shared across calls, so build new server
+    ## dictionaries instead of modifying the ones that it contains.
+    ##
+    ## Nested values that no override touches, e.g., a `server_defaults` list,
+    ## are still shared with the cached configuration. This is safe only
+    ## because KubeSpawner deep-copies `profile_list` before using it. Do not
+    ## modify `spawner.profile_list` in place.
+
     for server in get_servers(config, person):
         server_override = server.get("kubespawner_override", {})
-        server_includes = server_override.pop("include", [])
-        composite_override = copy.deepcopy(config.server_defaults)
+        server_includes = server_override.get("include", [])
+        composite_override = dict(config.server_defaults)
 
         for key in server_includes:
             override = config.server_overrides[key]
-            if not override.groups or set(override.groups).intersection(person.groups):
+            if not override.groups or not override.groups_set.isdisjoint(person.groups_set):
                 merge_override(composite_override, override.override, person.ospool)
-        merge_override(composite_override, server_override, person.ospool)
+        merge_override(
+            composite_override,
+            {k: v for k, v in server_override.items() if k != "include"},
+            person.ospool,
+        )
 
-        server["kubespawner_override"] = composite_override
-        spawner.profile_list.append(server)
+        spawner.profile_list.append({**server, "kubespawner_override": composite_override})
 
     return spawner._options_form_default()  # type: ignore[no-any-return]
 
@@ -131,7 +155,7 @@ def modify_pod_hook(spawner, pod: k8s.V1Pod) -> k8s.V1Pod:
     """
 
     notebook = get_notebook_container(pod)
-    person = comanage.get_person(spawner.userdata)
+    person = getattr(spawner, "person", None)
 
     if (
         person
@@ -161,13 +185,23 @@ def get_config() -> Configuration:
     """
 
     try:
-        config = baydemir.parsing.load_yaml(KUBESPAWNER_CONFIG, Configuration)
+        st = KUBESPAWNER_CONFIG.stat()
+        config = load_config(st.st_mtime_ns, st.st_size)
     except FileNotFoundError:
         config = Configuration(server_defaults={}, server_overrides={}, server_lists=[])
 
     return config
 
 
+@functools.lru_cache(maxsize=1)
+def load_config(mtime: int, size: int) -> Configuration:  # pylint: disable=unused-argument
+    """
+    Parses the configuration file, reusing the result until `mtime` or `size` changes.
+    """
+
+    return baydemir.parsing.load_yaml(KUBESPAWNER_CONFIG, Configuration)
+
+
 def get_notebook_container(pod: k8s.V1Pod) -> k8s.V1Container:
     """
     Returns the pod's notebook container.
@@ -188,18 +222,29 @@ def get_servers(
     """
 
     for spec in config.server_lists:
-        if not spec.groups or set(spec.groups).intersection(person.groups):
+        if not spec.groups or not spec.groups_set.isdisjoint(person.groups_set):
             for server in spec.servers:
                 yield server
 
 
+@functools.lru_cache(maxsize=1024)
+def parse_template(template: str) -> Tuple[str, ...]:
+    """
+    Splits a string into literal text alternating with `{user.<field>}` names.
+
+    For example, `"/home/{user.username}/"` yields `("/home/", "username", "/")`.
+    """
+
+    return tuple(USER_FIELD_RE.split(template))
+
+
 def build_value(raw_value: Any, user: Optional[comanage.OSPoolPerson]) -> Any:
     """
     Builds a Kubernetes Python API object or value.
     """
 
     if isinstance(raw_value, str):
-        if user:
+        if user and "{" in raw_value:
             ## The user's UID and GID should yield integers instead of a strings.
 
             if raw_value == "{user.uid}":
@@ -208,26 +253,35 @@ def build_value(raw_value: Any, user: Optional[comanage.OSPoolPerson]) -> Any:
             if raw_value == "{user.gid}":
                 return user.gid
 
-            for field in dataclasses.fields(user):
-                k = f"{{user.{field.name}}}"
-                v = getattr(user, field.name)
+            ## Substitute every `{user.<field>}` in a single pass. Unlike
+            ## `str.format_map`, this leaves any other braces untouched.
 
-                raw_value = raw_value.replace(k, str(v))
+            parts = parse_template(raw_value)
+
+            if len(parts) > 1:
+                values = {name: str(getattr(user, name)) for name in USER_FIELDS}
+
+                raw_value = "".join(
+                    values.get(p, f"{{user.{p}}}") if i % 2 else p for i, p in enumerate(parts)
+                )
 
         return raw_value
 
     if isinstance(raw_value, dict):
         ## The value could be an API object or a built-in dictionary.
 
+        ## Leave `raw_value` intact so that the parsed configuration can be reused.
+
         if "_" in raw_value:
-            cls = k8s.__dict__[raw_value.pop("_")]
+            cls = k8s.__dict__[raw_value["_"]]
         else:
             cls = dict
 
         args = {}
 
         for k, v in raw_value.items():
-            args[k] = build_value(v, user)
+            if k != "_":
+                args[k] = build_value(v, user)
 
         return cls(**args)
 
@@ -246,16 +300,18 @@ def merge_override(
     Merges one set of `kubespawner_override` keys into another.
 
     Unlike `KubeSpawner`, list values are concatenated, not replaced.
+
+    Only `target` itself is modified. Nested values are copied before being
+    merged into, so `target` may start as a shallow copy of another dict.
+    Nested values that `source` does not touch remain shared with that dict.
     """
 
     for k, raw_v in source.items():
         v = build_value(raw_v, user)  # substitute user.username, etc.
 
         if isinstance(v, dict):
-            target.setdefault(k, {})
-            target[k].update(v)
+            target[k] = {**target.get(k, {}), **v}
         elif isinstance(v, list):
-            target.setdefault(k, [])
-            target[k].extend(v)
+            target[k] = [*target.get(k, []), *v]
         else:
             target[k] = v
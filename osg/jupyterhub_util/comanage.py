@@ -3,7 +3,8 @@ Query OSG's COmanage infrastructure.
 """
 
 import dataclasses
-from typing import Any, Dict, List, Optional
+import functools
+from typing import Any, Dict, FrozenSet, List, Optional
 
 __all__ = [
     "COmanagePerson",
@@ -26,14 +27,16 @@ class COmanagePerson:
     groups: List[str]
     ospool: Optional[OSPoolPerson] = None
 
+    @functools.cached_property
+    def groups_set(self) -> FrozenSet[str]:
+        return frozenset(self.groups)
+
 
 def get_person(oidc_userinfo: Dict[str, Any]) -> Optional[COmanagePerson]:
     """
     Returns the COmanage person for the given OIDC "sub" claim.
     """
 
-    person = None
-
     # NOTE: The OIDC Client in COmanage must be configured to return the
     # claims below so that we can avoid querying LDAP, which will block the
     # current thread when using the `ldap3` library.
@@ -44,14 +47,15 @@ def get_person(oidc_userinfo: Dict[str, Any]) -> Optional[COmanagePerson]:
     uid = oidc_userinfo.get("unix_uid")
     gid = oidc_userinfo.get("unix_gid")
 
-    if oidc_sub and not person:
-        if username and uid and gid:
-            try:
-                ospool_person = OSPoolPerson(username, int(uid), int(gid))
-            except ValueError:
-                ospool_person = None
-        else:
-            ospool_person = None
-        person = COmanagePerson(oidc_sub, groups or [], ospool_person)
-
-    return person
+    if not oidc_sub:
+        return None
+
+    ospool_person = None
+
+    if username and uid and gid:
+        try:
+            ospool_person = OSPoolPerson(username, int(uid), int(gid))
+        except ValueError:
+            pass
+
+    return COmanagePerson(oidc_sub, groups or [], ospool_person)
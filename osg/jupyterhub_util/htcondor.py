@@ -4,7 +4,7 @@ Create HTCondor IDTOKENs.
 Based on: https://github.com/CoffeaTeam/coffea-casa/blob/master/charts/coffea-casa/files/hub/auth.py
 """
 
-import itertools
+import functools
 import os
 import time
 import uuid
@@ -25,17 +25,33 @@ def unscramble(buf: bytes) -> bytes:
     Undoes HTCondor's password scrambling.
     """
 
-    deadbeef = [0xDE, 0xAD, 0xBE, 0xEF]
+    ## XOR the whole buffer at once as a single integer.
 
-    return bytes(a ^ b for (a, b) in zip(buf, itertools.cycle(deadbeef)))
+    n = len(buf)
+    key = (b"\xde\xad\xbe\xef" * (n // 4 + 1))[:n]
+
+    return (int.from_bytes(buf, "big") ^ int.from_bytes(key, "big")).to_bytes(n, "big")
 
 
 def read_password(path: Union[str, os.PathLike]) -> bytes:
+    st = os.stat(path)
+    return load_password(os.fspath(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def load_password(  # pylint: disable=unused-argument
+    path: Union[str, bytes], mtime: int, size: int
+) -> bytes:
+    """
+    Reads a password file, reusing the result until `mtime` or `size` changes.
+    """
+
     with open(path, mode="rb") as fp:
         raw_password = fp.read()
     return unscramble(raw_password)
 
 
+@functools.lru_cache(maxsize=4)
 def derive_key(password: bytes) -> bytes:
     ## The parameters to HKDF are fixed as part of the protocol.
     hkdf = HKDF(